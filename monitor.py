@@ -1,12 +1,27 @@
 # monitor.py — Clean production version
+import argparse
+import hashlib
+import io
 import json
+import os
+import queue
 import re
 import sys
+import threading
+import time
+import traceback
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from playwright.sync_api import sync_playwright
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 CATALOG_URL = "https://secure.rec1.com/CA/calabasas-ca/catalog/index"
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 BASELINE_FILE = Path("baseline.json")
 
 TARGET_TITLES = [
@@ -14,24 +29,85 @@ TARGET_TITLES = [
     "Swim Lesson Level 2: Sea Horses",
 ]
 
+# Browsers scraping titles at the same time
+MAX_WORKERS = 2
+
 # regexes
-DATE_RANGE = re.compile(r"\b\d{1,2}/\d{1,2}\s*[-–]\s*\d{1,2}/\d{1,2}\b")
-DATE_SINGLE = re.compile(r"\b\d{1,2}/\d{1,2}\b")
-TIME_RANGE = re.compile(r"\b\d{1,2}:\d{2}\s*[AP]M\s*[-–]\s*\d{1,2}:\d{2}\s*[AP]M\b", re.I)
-TIME_SINGLE = re.compile(r"\b\d{1,2}:\d{2}\s*[AP]M\b", re.I)
-
-def extract_dates_times(text: str):
-    dates = set(DATE_RANGE.findall(text))
-    if not dates:
-        dates = set(DATE_SINGLE.findall(text))
-    times = set(TIME_RANGE.findall(text))
-    if not times:
-        times = set(TIME_SINGLE.findall(text))
-    return sorted(dates), sorted(times)
+# Dates and times in one pass: lastgroup is "d" or "t", and "dr"/"tr" are set
+# only for ranges
+DATE_TIME_ANY = re.compile(
+    r"\b(?:(?P<d>\d{1,2}/\d{1,2}(?P<dr>\s*[-–]\s*\d{1,2}/\d{1,2})?)"
+    r"|(?P<t>\d{1,2}:\d{2}\s*[AP]M(?P<tr>\s*[-–]\s*\d{1,2}:\d{2}\s*[AP]M)?))\b",
+    re.I,
+)
+DASH_RUN = re.compile(r"-+")
+
+class _SlugTable(dict):
+    """str.translate table: keeps a-z/0-9, maps every other code point to '-'."""
+    def __missing__(self, key):
+        return "-"
+
+SLUG_TABLE = _SlugTable((ord(c), c) for c in "abcdefghijklmnopqrstuvwxyz0123456789")
+
+def _slugify(title):
+    return DASH_RUN.sub("-", title.lower().translate(SLUG_TABLE)).strip("-")
+
+# (title, slug, heading pattern) for each target, computed once at import
+TITLE_INFO = [(t, _slugify(t), re.compile(re.escape(t), re.I)) for t in TARGET_TITLES]
+
+def extract_dates_times(text: str, max_dates=None, max_times=None):
+    """Return sorted unique (dates, times) found in text.
+
+    If max_dates/max_times are given, scanning stops as soon as there are more
+    date (or time) ranges than that; the result is then over the limit anyway,
+    so callers that reject oversized results can skip the rest of a big text.
+    """
+    # Dates need a "/" and times a ":"; skip the regex scan when it can't match
+    if "/" not in text and ":" not in text:
+        return [], []
+    date_ranges, date_singles, time_ranges, time_singles = set(), set(), set(), set()
+    for m in DATE_TIME_ANY.finditer(text):
+        if m.lastgroup == "d":
+            if m.group("dr"):
+                date_ranges.add(m.group(0))
+                if max_dates is not None and len(date_ranges) > max_dates:
+                    break
+            else:
+                date_singles.add(m.group(0))
+        else:
+            if m.group("tr"):
+                time_ranges.add(m.group(0))
+                if max_times is not None and len(time_ranges) > max_times:
+                    break
+            else:
+                time_singles.add(m.group(0))
+    # Ranges win; singles only count when there are no ranges
+    return sorted(date_ranges or date_singles), sorted(time_ranges or time_singles)
+
+# Jumps to the bottom (triggering lazy load) and returns the page height
+SCROLL_BOTTOM_JS = "() => { window.scrollTo(0, document.body.scrollHeight); return document.body.scrollHeight; }"
+
+def _scroll_until_stable(page, max_iters=6):
+    """Scroll to the bottom until lazy loading stops growing the page."""
+    from playwright.sync_api import Error as PWError
+
+    for _ in range(max_iters):
+        height = page.evaluate(SCROLL_BOTTOM_JS)
+        try:
+            # networkidle only fires once per navigation, so watch the height
+            page.wait_for_function("h => document.body.scrollHeight > h", arg=height, timeout=1500)
+        except PWError:
+            break
 
 def open_aquatics(page):
+    from playwright.sync_api import Error as PWError
+
     page.goto(CATALOG_URL, wait_until="domcontentloaded")
-    page.wait_for_timeout(2000)
+    _frames_cache.pop(page, None)
+    try:
+        page.wait_for_selector("text=Aquatics", timeout=5000)
+    except PWError:
+        pass
     
     # Click Aquatics category
     for label in ["Aquatics Programs", "Aquatics"]:
@@ -39,17 +115,24 @@ def open_aquatics(page):
         if loc.count():
             try:
                 loc.first.click(timeout=3000)
-                page.wait_for_timeout(1200)
+                try:
+                    page.wait_for_load_state("networkidle", timeout=5000)
+                except PWError:
+                    pass
                 break
-            except:
+            except PWError:
                 pass
     
     # Scroll to load content
-    for i in range(15):
-        page.mouse.wheel(0, 1200)
-        page.wait_for_timeout(150)
+    _scroll_until_stable(page)
+
+# page -> scopes from _frames(); cleared by open_aquatics after navigating
+_frames_cache = weakref.WeakKeyDictionary()
 
 def _frames(page):
+    cached = _frames_cache.get(page)
+    if cached is not None:
+        return cached
     fr = [page]
     for f in page.frames:
         try:
@@ -57,11 +140,22 @@ def _frames(page):
                 fr.append(f)
         except:
             continue
+    _frames_cache[page] = fr
     return fr
 
-def _find_heading_anywhere(page, title):
-    """Find the visible heading element containing the title text."""
-    patt = re.compile(re.escape(title), re.I)
+def _find_heading_anywhere(page, patt):
+    """Find the visible heading element matching the compiled title pattern.
+
+    The list can still be rendering after the category click (networkidle may
+    already have fired), so wait for the title itself before looking it up.
+    """
+    from playwright.sync_api import Error as PWError
+
+    try:
+        page.get_by_text(patt).first.wait_for(state="visible", timeout=10000)
+    except PWError:
+        # Not on the top page; frames may have attached while we waited
+        _frames_cache.pop(page, None)
     for scope in _frames(page):
         link = scope.get_by_role("link", name=patt)
         if link.count() > 0:
@@ -71,256 +165,483 @@ def _find_heading_anywhere(page, title):
             return el
     return None
 
+# Returns the table's header labels and the text of every data-row cell in one
+# round trip, instead of a locator call per header and per cell.
+TABLE_CELLS_JS = """
+t => {
+    const ths = [...t.querySelectorAll("thead tr th, tr th")].map(e => (e.innerText || "").trim().toLowerCase());
+    let rows = [...t.querySelectorAll("tbody tr")];
+    if (!rows.length) {
+        rows = [...t.querySelectorAll("tr")];
+        if (rows.length > 1) rows = rows.slice(1);
+    }
+    return {ths, rows: rows.map(r => [...r.cells].map(c => (c.innerText || "").trim()))};
+}
+"""
+
+def _sessions_from_snapshot(data):
+    """Parse a TABLE_CELLS_JS snapshot ({ths, rows}) into session dicts."""
+    out = []
+
+    # Find date and time columns
+    dates_col = times_col = None
+    for i, h in enumerate(data["ths"]):
+        if dates_col is None and "date" in h:
+            dates_col = i
+        if times_col is None and ("time" in h or "times" in h):
+            times_col = i
+
+    # Fallback to typical CivicRec column order
+    if dates_col is None:
+        dates_col = 4
+    if times_col is None:
+        times_col = 5
+
+    # Parse each row
+    cols = (dates_col,) if dates_col == times_col else (dates_col, times_col)
+    for cells in data["rows"]:
+        combined = " ".join(cells[i] for i in cols if i < len(cells))
+        d_dates, d_times = extract_dates_times(combined)
+        if d_dates or d_times:
+            out.append({"dates": d_dates or ["n/a"], "times": d_times or ["n/a"]})
+    return out
+
 def parse_table_by_headers(tbl):
     """Parse a plain HTML table that has session data."""
-    out = []
+    from playwright.sync_api import Error as PWError
+
     try:
         tbl.wait_for(state="visible", timeout=3000)
-    except:
+    except PWError:
         pass
 
     try:
-        # Find date and time columns
-        ths = tbl.locator("thead tr th, tr th")
-        dates_col = times_col = None
-
-        if ths.count() > 0:
-            for i in range(ths.count()):
-                h = (ths.nth(i).inner_text() or "").strip().lower()
-                if dates_col is None and "date" in h:
-                    dates_col = i
-                if times_col is None and ("time" in h or "times" in h):
-                    times_col = i
-
-        # Fallback to typical CivicRec column order
-        if dates_col is None:
-            dates_col = 4
-        if times_col is None:
-            times_col = 5
-
-        # Get data rows
-        rows = tbl.locator("tbody tr")
-        if rows.count() == 0:
-            all_rows = tbl.locator("tr")
-            if all_rows.count() > 1:
-                rows = tbl.locator("tr:not(:first-child)")
-            else:
-                rows = tbl.locator("tr")
+        data = tbl.evaluate(TABLE_CELLS_JS)
+    except PWError:
+        return []
+    return _sessions_from_snapshot(data)
 
-        def cell_text(row, idx):
-            if idx is None:
-                return ""
+def _sessions_from_iframes(page):
+    """Check all visible iframes for session tables through Playwright frames.
+
+    Only used when SESSION_TABLES_JS reports iframes it couldn't read itself
+    (cross-origin, or not loaded yet -- this path waits for them).
+    """
+    from playwright.sync_api import Error as PWError
+
+    # :visible filters in the selector engine, saving an is_visible() per iframe
+    for iframe in page.locator("iframe:visible").all():
+        try:
+            handle = iframe.element_handle()
+            fr = handle.content_frame() if handle else None
+            if not fr:
+                continue
             try:
-                cell = row.locator(f"td:nth-child({idx+1}), th:nth-child({idx+1})")
-                return (cell.inner_text() or "").strip()
-            except:
-                return ""
-
-        # Parse each row
-        n = rows.count()
-        for i in range(n):
-            r = rows.nth(i)
-            dates_txt = cell_text(r, dates_col)
-            times_txt = cell_text(r, times_col)
-            d_dates, d_times = extract_dates_times(f"{dates_txt} {times_txt}")
-            if d_dates or d_times:
-                out.append({"dates": d_dates or ["n/a"], "times": d_times or ["n/a"]})
-    except:
+                fr.wait_for_load_state("domcontentloaded", timeout=3000)
+            except PWError:
+                pass
+            # :has-text is case-insensitive and filters in the frame, so only
+            # likely session tables have their text sent back
+            iframe_tables = fr.locator("table:has-text('DATES'):has-text('TIMES')")
+            for t, text in enumerate(iframe_tables.all_inner_texts()):
+                if len(text) > 100:
+                    tbl = iframe_tables.nth(t)
+                    parsed = parse_table_by_headers(tbl)
+                    if parsed:
+                        return parsed
+        except PWError:
+            pass
+    return []
+
+MODAL_SELECTOR = '[class*="modal"][class*="show"], .modal.in, [class*="modal"][style*="display: block"], [role="dialog"]'
+
+# Snapshots candidate session tables in priority order, in one round trip:
+#   1. session tables inside visible, same-origin, loaded iframes
+#   2. main-page session tables whose nearest div/section mentions the title
+#   3. the first table of visible modals that mention the title and aren't
+#      the navigation/login panels
+# Stops at the first table that _sessions_from_snapshot will parse to sessions:
+# `parses` repeats its column choice, and sessionText only matches where
+# DATE_TIME_ANY would. iframesPending is set when a visible iframe couldn't be
+# read from here.
+SESSION_TABLES_JS = """
+([title, modalSelector]) => {
+    const snapshot = """ + TABLE_CELLS_JS.strip() + """;
+    const want = title.toLowerCase();
+    const rendered = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    const isSessionTable = (t, minLen) => {
+        const text = t.innerText || "";
+        const upper = text.toUpperCase();
+        return text.length >= minLen && upper.includes("DATES") && upper.includes("TIMES");
+    };
+    const sessionText = /(?<![\\p{L}\\p{N}_])(?:\\d{1,2}\\/\\d{1,2}|\\d{1,2}:\\d{2}[ \\t\\n\\v\\f\\r]*[ap]m)(?![\\p{L}\\p{N}_])/iu;
+    const parses = snap => {
+        let datesCol = snap.ths.findIndex(h => h.includes("date"));
+        let timesCol = snap.ths.findIndex(h => h.includes("time"));
+        if (datesCol < 0) datesCol = 4;
+        if (timesCol < 0) timesCol = 5;
+        const cols = datesCol === timesCol ? [datesCol] : [datesCol, timesCol];
+        return snap.rows.some(r => sessionText.test(cols.filter(i => i < r.length).map(i => r[i]).join(" ")));
+    };
+    const tables = [];
+    const take = t => {
+        const snap = snapshot(t);
+        tables.push(snap);
+        return parses(snap);
+    };
+    let iframesPending = false;
+
+    for (const f of document.querySelectorAll("iframe")) {
+        if (!rendered(f)) continue;
+        let doc = null;
+        try { doc = f.contentDocument; } catch (e) {}
+        if (!doc || doc.readyState === "loading" || (doc.URL === "about:blank" && f.src)) {
+            iframesPending = true;
+            continue;
+        }
+        for (const t of doc.querySelectorAll("table")) {
+            if (isSessionTable(t, 101) && take(t)) return {tables, iframesPending};
+        }
+    }
+
+    for (const t of document.querySelectorAll("table")) {
+        if (!isSessionTable(t, 100)) continue;
+        const parent = t.parentElement && t.parentElement.closest("div, section");
+        if (parent && !(parent.innerText || "").toLowerCase().includes(want)) continue;
+        if (take(t)) return {tables, iframesPending};
+    }
+
+    for (const el of document.querySelectorAll(modalSelector)) {
+        if (!rendered(el)) continue;
+        const text = el.innerText || "";
+        if (!text.toLowerCase().includes(want)) continue;
+        if (text.includes("Clear All Filters") || text.slice(0, 200).includes("Log In with Email")) continue;
+        const t = el.querySelector("table");
+        const tText = t ? (t.innerText || "") : "";
+        if (tText.length <= 100 || !tText.toUpperCase().includes("DATES")) continue;
+        if (take(t)) return {tables, iframesPending};
+    }
+
+    return {tables, iframesPending};
+}
+"""
+
+def _sessions_from_tables(page, title):
+    """STRATEGIES 1-3: iframe, titled page, and modal session tables.
+
+    All candidates come back from one SESSION_TABLES_JS call; the first that
+    parses to sessions wins.
+    """
+    from playwright.sync_api import Error as PWError
+
+    try:
+        data = page.evaluate(SESSION_TABLES_JS, [title, MODAL_SELECTOR])
+    except PWError:
+        return []
+
+    # Unreadable iframes keep their original top priority
+    if data["iframesPending"]:
+        parsed = _sessions_from_iframes(page)
+        if parsed:
+            return parsed
+
+    for snap in data["tables"]:
+        parsed = _sessions_from_snapshot(snap)
+        if parsed:
+            return parsed
+    return []
+
+# innerText of the first 100 div/section/dialog elements that pass the cheap
+# Strategy 4 filters, in document order, fetched in one round trip. innerText
+# (not textContent) keeps the line/tab breaks the date/time regexes rely on.
+CONTAINER_TEXTS_JS = """
+title => {
+    const want = title.toLowerCase();
+    const out = [];
+    const els = document.querySelectorAll('div, section, [role="dialog"]');
+    for (let i = 0; i < Math.min(100, els.length); i++) {
+        const text = els[i].innerText || "";
+        // Must have minimum content, our title, and something date/time-like
+        if (text.length < 100 || !text.toLowerCase().includes(want)) continue;
+        if (!text.includes("/") || !text.includes(":")) continue;
+        // Skip navigation/filter panels - they appear early in DOM
+        // and always have these specific strings near the start
+        const start = text.slice(0, 500);
+        if (start.includes("Clear All Filters") && start.includes("Cart") && start.includes("Filter")) continue;
+        out.push(text);
+    }
+    return out;
+}
+"""
+
+def _sessions_from_containers(page, title):
+    """STRATEGY 4: Search all containers for ones with title + dates/times.
+
+    The modal content may be in a container that's not properly marked as a modal.
+    """
+    from playwright.sync_api import Error as PWError
+
+    try:
+        texts = page.evaluate(CONTAINER_TEXTS_JS, title)
+    except PWError:
+        return []
+
+    for text in texts:
+        # Extract dates and times (stops early once past the limits below)
+        dates, times = extract_dates_times(text, max_dates=15, max_times=30)
+
+        # Must have both dates AND times
+        if dates and times:
+            # Additional validation: reasonable number of entries
+            if len(dates) <= 15 and len(times) <= 30:
+                return [{"dates": dates, "times": times}]
+    return []
+
+# True once an open modal shows session data: a date and a time in its text,
+# or in a same-origin iframe inside it (table or plain text, so Strategy 4
+# content counts too). Checks rendering itself, since Bootstrap keeps closed
+# modals in the DOM.
+SESSION_READY_JS = """
+modalSelector => {
+    const rendered = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    const hasSession = text => /\\d{1,2}\\/\\d{1,2}/.test(text) && /\\d{1,2}:\\d{2}/.test(text);
+    for (const m of document.querySelectorAll(modalSelector)) {
+        if (!rendered(m)) continue;
+        if (hasSession(m.innerText || "")) return true;
+        for (const f of m.querySelectorAll("iframe")) {
+            let doc = null;
+            try { doc = f.contentDocument; } catch (e) {}
+            if (doc && doc.body && hasSession(doc.body.innerText || "")) return true;
+        }
+    }
+    return false;
+}
+"""
+
+def _wait_for_sessions(page, timeout=5000):
+    """Best-effort wait for the opened modal's sessions to render."""
+    from playwright.sync_api import Error as PWError
+
+    try:
+        page.wait_for_function(SESSION_READY_JS, arg=MODAL_SELECTOR, timeout=timeout)
+    except PWError:
         pass
-    
-    return out
 
-def list_sessions_for_item(page, title):
-    """Click the program title to open a modal, then parse the session table."""
+def list_sessions_for_item(page, title, patt):
+    """Click the program title to open a modal, then parse the session table.
+
+    `patt` is the title's precompiled pattern from TITLE_INFO. Strategies run
+    in order and stop at the first one that yields sessions.
+    """
+    from playwright.sync_api import Error as PWError, TimeoutError as PWTimeout
+
     sessions = []
-    modal_found = False
-    
-    heading = _find_heading_anywhere(page, title)
+
+    heading = _find_heading_anywhere(page, patt)
     if not heading:
         return sessions
-    
+
     try:
-        # Click to open modal
-        heading.click(timeout=3000)
-        page.wait_for_timeout(3000)
-        
-        # STRATEGY 1: Check all visible iframes for session tables
-        all_iframes = page.locator("iframe")
-        for i in range(all_iframes.count()):
-            iframe = all_iframes.nth(i)
-            try:
-                if iframe.is_visible():
-                    handle = iframe.element_handle()
-                    fr = handle.content_frame() if handle else None
-                    if fr:
-                        iframe_tables = fr.locator("table")
-                        for t in range(iframe_tables.count()):
-                            tbl = iframe_tables.nth(t)
-                            text = tbl.inner_text()
-                            if len(text) > 100 and "DATES" in text.upper() and "TIMES" in text.upper():
-                                parsed = parse_table_by_headers(tbl)
-                                if parsed:
-                                    sessions.extend(parsed)
-                                    modal_found = True
-                                    break
-                        if modal_found:
-                            break
-            except:
-                pass
-        
-        # STRATEGY 2: Check all tables on main page
-        if not modal_found:
-            tables = page.locator("table")
-            for i in range(tables.count()):
-                tbl = tables.nth(i)
-                try:
-                    text = tbl.inner_text()
-                    if len(text) < 100:
-                        continue
-                    
-                    if "DATES" in text.upper() and "TIMES" in text.upper():
-                        # Verify this table belongs to our program
-                        parent = tbl.locator("xpath=ancestor::*[self::div or self::section][1]")
-                        if parent.count() > 0:
-                            parent_text = parent.inner_text()
-                            if title.lower() not in parent_text.lower():
-                                continue
-                        
-                        parsed = parse_table_by_headers(tbl)
-                        if parsed:
-                            sessions.extend(parsed)
-                            modal_found = True
-                            break
-                except:
-                    pass
-        
-        # STRATEGY 3: Check for proper modal containers
-        if not modal_found:
-            modals = page.locator('[class*="modal"][class*="show"], [class*="modal"][style*="display: block"], [role="dialog"]')
-            
-            for i in range(modals.count()):
-                try:
-                    modal = modals.nth(i)
-                    if not modal.is_visible():
-                        continue
-                    
-                    text = modal.inner_text()
-                    
-                    # Must contain title AND must NOT be navigation
-                    if title.lower() not in text.lower():
-                        continue
-                    if "Clear All Filters" in text or "Log In with Email" in text[:200]:
-                        continue
-                    
-                    # Look for table in this modal
-                    tbl = modal.locator("table").first
-                    if tbl.count() > 0:
-                        tbl_text = tbl.inner_text()
-                        if len(tbl_text) > 100 and "DATES" in tbl_text.upper():
-                            parsed = parse_table_by_headers(tbl)
-                            if parsed:
-                                sessions.extend(parsed)
-                                modal_found = True
-                                break
-                except:
-                    pass
-        
-        # STRATEGY 4: Search all containers for ones with title + dates/times
-        # The modal content may be in a container that's not properly marked as a modal
-        if not modal_found:
-            all_containers = page.locator('div, section, [role="dialog"]')
-            
-            for i in range(min(100, all_containers.count())):
-                try:
-                    container = all_containers.nth(i)
-                    text = container.inner_text()
-                    
-                    # Must have minimum content
-                    if len(text) < 100:
-                        continue
-                    
-                    # Must contain our title
-                    if title.lower() not in text.lower():
-                        continue
-                    
-                    # Skip navigation/filter panels - they appear early in DOM
-                    # and always have these specific strings near the start
-                    text_start = text[:500]
-                    if "Clear All Filters" in text_start and "Cart" in text_start and "Filter" in text_start:
-                        continue
-                    
-                    # Extract dates and times
-                    dates, times = extract_dates_times(text)
-                    
-                    # Must have both dates AND times
-                    if dates and times:
-                        # Additional validation: reasonable number of entries
-                        if len(dates) <= 15 and len(times) <= 30:
-                            sessions.append({"dates": dates, "times": times})
-                            modal_found = True
-                            break
-                except:
-                    continue
-        
-        # Close modal
+        # Click to open modal; if it never opens there's nothing to scan
         try:
-            page.keyboard.press("Escape")
-            page.wait_for_timeout(500)
-        except:
-            pass
-        
-    except:
+            heading.click(timeout=3000)
+        except PWTimeout:
+            return sessions
+        _wait_for_sessions(page)
+
+        sessions = (
+            _sessions_from_tables(page, title)
+            or _sessions_from_containers(page, title)
+        )
+        # The modal is left open: the page is closed next in one-shot mode and
+        # navigated again by open_aquatics in watch mode
+    except PWError:
         pass
-    
-    sessions.sort(key=lambda s: (";".join(s["dates"]), ";".join(s["times"])))
-    return sessions
 
-def get_items_with_sessions():
+    # Drop rows with identical dates and times
+    seen = set()
+    unique = []
+    for s in sessions:
+        key = (tuple(s["dates"]), tuple(s["times"]))
+        if key not in seen:
+            seen.add(key)
+            unique.append(s)
+
+    unique.sort(key=lambda s: (";".join(s["dates"]), ";".join(s["times"])))
+    return unique
+
+# Browser profile (HTTP cache, cookies) kept between runs; CI caches this dir
+PROFILE_DIR = Path(".pw-profile")
+
+# Hosts the scraper never needs. They're blocked with Chromium flags rather than
+# ctx.route(), because request interception disables the profile's HTTP cache.
+BLOCKED_HOSTS = ("googletagmanager.com", "google-analytics.com", "doubleclick.net", "hotjar.com", "segment.com", "segment.io", "facebook.net")
+
+BROWSER_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--blink-settings=imagesEnabled=false',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-background-networking',
+    '--disable-extensions',
+    '--host-resolver-rules=' + ", ".join(f"MAP *.{h} ~NOTFOUND, MAP {h} ~NOTFOUND" for h in BLOCKED_HOSTS),
+]
+
+def _launch_context(p, slug):
+    """Launch the persistent browser context for one title; returns (ctx, page).
+
+    Each title gets its own profile dir, since Chromium locks a profile to one
+    running browser.
+    """
+    ctx = p.chromium.launch_persistent_context(
+        str(PROFILE_DIR / slug),
+        headless=True,
+        args=BROWSER_ARGS,
+        user_agent=USER_AGENT,
+        viewport={'width': 1920, 'height': 1080},
+        service_workers="block",
+    )
+
+    # Hide webdriver property; registered once on the context, covering its pages
+    ctx.add_init_script("""
+        Object.defineProperty(navigator, 'webdriver', {
+            get: () => undefined
+        });
+    """)
+    page = ctx.pages[0] if ctx.pages else ctx.new_page()
+    return ctx, page
+
+def _scrape_title(info):
+    """Open the catalog in a browser and return the sessions for one TITLE_INFO entry.
+
+    Playwright's sync API is bound to the thread that started it, so each
+    worker thread gets its own sync_playwright() instance and browser.
+    """
+    # Imported here so diff/report helpers don't pay Playwright's import cost
+    from playwright.sync_api import sync_playwright
+
+    title, slug, patt = info
+
     with sync_playwright() as p:
-        browser = p.chromium.launch(
-            headless=True,
-            args=['--disable-blink-features=AutomationControlled']
-        )
-        ctx = browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            viewport={'width': 1920, 'height': 1080},
-        )
-        page = ctx.new_page()
-        
-        # Hide webdriver property
-        page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-        """)
+        ctx, page = _launch_context(p, slug)
         
         open_aquatics(page)
 
-        items = []
-        for title in TARGET_TITLES:
-            url = "inline:" + re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
-            try:
-                sessions = list_sessions_for_item(page, title)
-            except:
-                sessions = []
-            items.append({"title": title, "url": url, "sessions": sessions})
-            page.wait_for_timeout(1000)
+        try:
+            sessions = list_sessions_for_item(page, title, patt)
+        except:
+            sessions = []
 
-        browser.close()
+        ctx.close()
+
+    return sessions
+
+def _build_items(results):
+    """Turn per-title sessions (in TITLE_INFO order) into sorted baseline items."""
+    items = []
+    for (title, slug, _), sessions in zip(TITLE_INFO, results):
+        items.append({
+            "title": title,
+            "url": "inline:" + slug,
+            "sessions": sessions,
+            "sessions_hash": sessions_digest(sessions),
+        })
 
     items.sort(key=lambda x: (x["title"].lower(), x["url"] or ""))
     return items
 
+def get_items_with_sessions():
+    # Titles are independent modals, so scrape them concurrently
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(TARGET_TITLES))) as pool:
+        results = list(pool.map(_scrape_title, TITLE_INFO))
+    return _build_items(results)
+
+def _watch_title(info, jobs, results):
+    """Watch-mode thread: keep one browser open for a title and scrape it each
+    time a job arrives on `jobs`. A None job closes the browser and exits."""
+    from playwright.sync_api import sync_playwright
+
+    title, slug, patt = info
+    closing = False
+
+    try:
+        with sync_playwright() as p:
+            ctx = page = None
+            while jobs.get() is not None:
+                try:
+                    if ctx is None:
+                        ctx, page = _launch_context(p, slug)
+                    open_aquatics(page)
+                    try:
+                        sessions = list_sessions_for_item(page, title, patt)
+                    except:
+                        sessions = []
+                    results.put((title, sessions))
+                except Exception as e:
+                    # Relaunch on the next cycle rather than reuse a broken browser
+                    try:
+                        ctx.close()
+                    except:
+                        pass
+                    ctx = page = None
+                    results.put((title, e))
+            closing = True
+            if ctx is not None:
+                ctx.close()
+    except Exception as e:
+        # Playwright itself failed (e.g. sync_playwright() couldn't start):
+        # answer every job with the error so Watcher.scrape() never hangs
+        while not closing and jobs.get() is not None:
+            results.put((title, e))
+
+class Watcher:
+    """Long-lived per-title browsers for watch mode.
+
+    scrape() is a drop-in for get_items_with_sessions() that reuses the open
+    browsers (and their warm caches) instead of launching new ones each time.
+    """
+
+    def __init__(self):
+        self.results = queue.Queue()
+        self.jobs = [queue.Queue() for _ in TITLE_INFO]
+        self.threads = [
+            threading.Thread(target=_watch_title, args=(info, jobs, self.results), daemon=True)
+            for info, jobs in zip(TITLE_INFO, self.jobs)
+        ]
+        for t in self.threads:
+            t.start()
+
+    def scrape(self):
+        for jobs in self.jobs:
+            jobs.put(True)
+        found = dict(self.results.get() for _ in self.jobs)
+        for result in found.values():
+            if isinstance(result, Exception):
+                raise result
+        return _build_items([found[title] for title, _, _ in TITLE_INFO])
+
+    def close(self):
+        for jobs in self.jobs:
+            jobs.put(None)
+        for t in self.threads:
+            t.join(timeout=30)
+
 def load_baseline():
     if BASELINE_FILE.exists():
         try:
-            return json.loads(BASELINE_FILE.read_text())
+            raw = BASELINE_FILE.read_bytes()
+            return orjson.loads(raw) if orjson else json.loads(raw)
         except:
             return {"items": [], "last_updated": None}
     return {"items": [], "last_updated": None}
 
 def save_baseline(data):
-    BASELINE_FILE.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+    # orjson's OPT_INDENT_2 output matches json.dumps(indent=2, ensure_ascii=False)
+    if orjson:
+        BASELINE_FILE.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with BASELINE_FILE.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
 
 def _has_real_sessions(item):
     for s in item.get("sessions", []):
@@ -328,13 +649,33 @@ def _has_real_sessions(item):
             return True
     return False
 
+def _json_digest(obj):
+    payload = json.dumps(obj, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def items_digest(items):
+    """Stable digest of scraped items, stored in the baseline as "hash"."""
+    return _json_digest(items)
+
+def sessions_digest(sessions):
+    """Stable digest of one item's sessions, stored on it as "sessions_hash"."""
+    return _json_digest(sessions)
+
+# Stand-in for a title missing from one side of diff_items; only ever read
+_EMPTY_ITEM = {"title": None, "url": None, "sessions": []}
+
 def diff_items(old_items, new_items):
     old_map = {i["title"]: i for i in old_items}
     new_map = {i["title"]: i for i in new_items}
     added, removed, changed = [], [], []
     for t in TARGET_TITLES:
-        old = old_map.get(t, {"title": t, "url": None, "sessions": []})
-        new = new_map.get(t, {"title": t, "url": None, "sessions": []})
+        old = old_map.get(t, _EMPTY_ITEM)
+        new = new_map.get(t, _EMPTY_ITEM)
+        # Matching stored hashes mean identical sessions, so nothing can have
+        # been added, removed or changed; skip the scans and deep compare
+        old_hash = old.get("sessions_hash")
+        if old_hash and old_hash == new.get("sessions_hash"):
+            continue
         old_present = _has_real_sessions(old)
         new_present = _has_real_sessions(new)
         if not old_present and new_present:
@@ -351,66 +692,147 @@ def diff_items(old_items, new_items):
                 })
     return added, removed, changed
 
+NO_SESSIONS = [{"dates": ["(none)"], "times": ["(none)"]}]
+
 def format_report(current_items, added, removed, changed):
-    lines = [
-        "### Aquatics Monitor - " + datetime.utcnow().isoformat() + "Z",
-        "Tracking sessions (dates & times) for:",
-        "- " + TARGET_TITLES[0],
-        "- " + TARGET_TITLES[1],
-        "",
-        "**Current sessions (now):**",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+
+    # Added/changed entries share session dicts with current_items, so join
+    # each session's dates/times once and reuse the strings.
+    joined = {}
+    def dt(s):
+        key = id(s)
+        if key not in joined:
+            joined[key] = (", ".join(s["dates"]), ", ".join(s["times"]))
+        return joined[key]
+
+    def session_lines(sessions, prefix):
+        for s in sessions:
+            ds, ts = dt(s)
+            yield f"\n{prefix}dates: {ds} | times: {ts}"
+
+    w("### Aquatics Monitor - " + datetime.utcnow().isoformat() + "Z")
+    w("\nTracking sessions (dates & times) for:")
+    w("\n- " + TARGET_TITLES[0])
+    w("\n- " + TARGET_TITLES[1])
+    w("\n")
+    w("\n**Current sessions (now):**")
     for it in current_items:
         title = it["title"]
         url = it.get("url") or "(inline)"
-        lines.append(f"- {title} - {url}")
+        w(f"\n- {title} - {url}")
         if it.get("sessions"):
-            for s in it["sessions"]:
-                lines.append(f"  * dates: {', '.join(s['dates'])} | times: {', '.join(s['times'])}")
+            buf.writelines(session_lines(it["sessions"], "  * "))
         else:
-            lines.append("  * (no sessions found)")
+            w("\n  * (no sessions found)")
 
     if added:
-        lines.append("")
-        lines.append("**Added (now present):**")
+        w("\n")
+        w("\n**Added (now present):**")
         for a in added:
-            lines.append(f"- {a['title']} - {a.get('url','')}")
-            for s in a.get("sessions", []):
-                lines.append(f"  * dates: {', '.join(s['dates'])} | times: {', '.join(s['times'])}")
+            w(f"\n- {a['title']} - {a.get('url','')}")
+            buf.writelines(session_lines(a.get("sessions", []), "  * "))
 
     if removed:
-        lines.append("")
-        lines.append("**Removed (now missing):**")
+        w("\n")
+        w("\n**Removed (now missing):**")
         for r in removed:
-            lines.append(f"- {r['title']} - {r.get('url','')}")
-            for s in r.get("sessions", []):
-                lines.append(f"  * last dates: {', '.join(s['dates'])} | times: {', '.join(s['times'])}")
+            w(f"\n- {r['title']} - {r.get('url','')}")
+            buf.writelines(session_lines(r.get("sessions", []), "  * last "))
 
     if changed:
-        lines.append("")
-        lines.append("**Changed sessions:**")
+        w("\n")
+        w("\n**Changed sessions:**")
         for c in changed:
-            lines.append(f"- {c['title']} - {c.get('url','')}")
-            lines.append("  old:")
-            for s in (c["old_sessions"] or [{"dates":["(none)"],"times":["(none)"]}]):
-                lines.append(f"    * dates: {', '.join(s['dates'])} | times: {', '.join(s['times'])}")
-            lines.append("  new:")
-            for s in (c["new_sessions"] or [{"dates":["(none)"],"times":["(none)"]}]):
-                lines.append(f"    * dates: {', '.join(s['dates'])} | times: {', '.join(s['times'])}")
+            w(f"\n- {c['title']} - {c.get('url','')}")
+            w("\n  old:")
+            buf.writelines(session_lines(c["old_sessions"] or NO_SESSIONS, "    * "))
+            w("\n  new:")
+            buf.writelines(session_lines(c["new_sessions"] or NO_SESSIONS, "    * "))
+
+    return buf.getvalue()
+
+def run_once(scrape=get_items_with_sessions):
+    """Scrape, diff against the baseline, print the report and save the new
+    baseline. Returns True when changes were detected."""
+    baseline = load_baseline()
+    items = scrape()
+    digest = items_digest(items)
+    if digest == baseline.get("hash"):
+        # Identical to the baseline; nothing to diff. The report is still
+        # built because the daily email attaches it.
+        added, removed, changed = [], [], []
+    else:
+        added, removed, changed = diff_items(baseline["items"], items)
+    report = format_report(items, added, removed, changed)
+    print(report, flush=True)
+    save_baseline({"items": items, "last_updated": datetime.utcnow().isoformat(), "hash": digest})
+    return bool(added or removed or changed)
+
+def _baseline_ttl():
+    """AQUATICS_TTL_SEC as seconds; unset, empty or invalid means 0 (off)."""
+    try:
+        return max(0, int(os.environ.get("AQUATICS_TTL_SEC", "0")))
+    except ValueError:
+        return 0
+
+def baseline_is_fresh(baseline, ttl=None):
+    """True if the baseline's last_updated is less than `ttl` seconds old.
+
+    `ttl` defaults to AQUATICS_TTL_SEC: a baseline that fresh is reported as-is
+    without launching a browser. Uses the stored timestamp, not the file's
+    mtime, which a checkout resets.
+    """
+    if ttl is None:
+        ttl = _baseline_ttl()
+    if ttl <= 0 or not baseline.get("last_updated"):
+        return False
+    try:
+        updated = datetime.fromisoformat(baseline["last_updated"])
+    except (TypeError, ValueError):
+        return False
+    return (datetime.utcnow() - updated).total_seconds() < ttl
 
-    return "\n".join(lines)
+def _print_error(e):
+    print("### Aquatics Monitor - ERROR\n\n" + str(e), flush=True)
+    print("\n" + traceback.format_exc(), flush=True)
+
+def watch(interval):
+    """Re-check every `interval` seconds, keeping the browsers open between runs."""
+    watcher = Watcher()
+    try:
+        while True:
+            started = time.monotonic()
+            try:
+                run_once(watcher.scrape)
+            except Exception as e:
+                _print_error(e)
+            time.sleep(max(0, interval - (time.monotonic() - started)))
+    finally:
+        watcher.close()
 
 def main():
+    parser = argparse.ArgumentParser(description="Monitor Calabasas aquatics swim lesson sessions.")
+    parser.add_argument(
+        "--watch", type=float, metavar="SECONDS",
+        help="keep running and re-check every SECONDS with the browsers kept open (default: run once)",
+    )
+    args = parser.parse_args()
+    if args.watch:
+        watch(args.watch)
+        return
+
     try:
-        items = get_items_with_sessions()
         baseline = load_baseline()
-        added, removed, changed = diff_items(baseline["items"], items)
-        report = format_report(items, added, removed, changed)
-        print(report, flush=True)
-        save_baseline({"items": items, "last_updated": datetime.utcnow().isoformat()})
-        
+        if baseline_is_fresh(baseline):
+            # Scraped moments ago; report the baseline without starting Chromium
+            print(format_report(baseline["items"], [], [], []), flush=True)
+            print("\n[EXIT CODE 0: No changes]", flush=True)
+            sys.exit(0)
+
         # Exit 1 ONLY when actual changes detected
-        has_changes = bool(added or removed or changed)
+        has_changes = run_once()
         if has_changes:
             print("\n[EXIT CODE 1: Changes detected]", flush=True)
             sys.exit(1)
@@ -418,11 +840,9 @@ def main():
             print("\n[EXIT CODE 0: No changes]", flush=True)
             sys.exit(0)
     except Exception as e:
-        print("### Aquatics Monitor - ERROR\n\n" + str(e), flush=True)
-        import traceback
-        print("\n" + traceback.format_exc(), flush=True)
+        _print_error(e)
         print("\n[EXIT CODE 0: Error occurred]", flush=True)
         sys.exit(0)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()